@@ -1,9 +1,33 @@
-import json
+import hashlib
 import logging
-import os.path
-from typing import Any, Dict
+import mmap
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Union
+
+from cachetools import TTLCache
+
+try:
+    import orjson as _json
+
+    def _canonical_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj, option=_json.OPT_SORT_KEYS)
+
+except ImportError:
+    import json as _json
+
+    def _canonical_dumps(obj: Any) -> bytes:
+        return _json.dumps(obj, sort_keys=True).encode("utf-8")
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from chaoslib.exceptions import ActivityFailed
 from chaoslib.types import Secrets
 from kubernetes import client
@@ -22,59 +46,111 @@ __all__ = [
     "replace_cluster_custom_object",
     "apply_from_json",
     "apply_from_yaml",
+    "apply_all_from_yaml",
 ]
 logger = logging.getLogger("chaostoolkit")
 
 
-def apply_from_json(
-    resource: str = None, secrets: Secrets = None
-) -> Dict[str, Any]:
+def _enable_orjson_serializer() -> None:
     """
-    Apply the given custom resource, given as a JSON string, to the cluster.
+    Make the kubernetes client serialize request bodies with orjson.
+
+    The client dumps every request body with the stdlib json module,
+    which dominates client-side CPU for large custom resources. Rebind
+    the `json` name seen by `kubernetes.client.rest` to an orjson-backed
+    shim; the stdlib module itself is left untouched.
     """
-    obj = json.loads(resource)
-    api_version = obj.get("apiVersion")
-    kind = obj.get("kind")
-    ns = obj.get("metadata", {}).get("namespace", "default")
+    if _json.__name__ != "orjson":
+        logger.debug("orjson is not available, keeping stdlib serializer")
+        return
 
-    if not api_version:
-        raise ActivityFailed("missing apiVersion in resource")
+    import kubernetes.client.rest as _rest
 
-    if not kind:
-        raise ActivityFailed("missing kind in resource")
+    class _OrjsonShim:
+        loads = staticmethod(_json.loads)
+
+        @staticmethod
+        def dumps(obj: Any, **kwargs: Any) -> str:
+            return _json.dumps(obj).decode("utf-8")
+
+    _rest.json = _OrjsonShim
+
+
+if os.environ.get("CHAOSTOOLKIT_K8S_ORJSON_SERIALIZER") == "true":
+    _enable_orjson_serializer()
+
+
+def apply_from_json(
+    resource: str = None, refresh: bool = False, secrets: Secrets = None
+) -> Dict[str, Any]:
+    """
+    Apply the given custom resource, given as a JSON string, to the cluster.
 
-    group, version = api_version.rsplit("/", 1)
-    plural = get_plural(kind)
+    Set `refresh` to bypass the short-lived response cache.
+    """
+    obj = _json.loads(resource)
+    group, version, plural, ns = _extract_meta(obj)
 
     return create_custom_object(
-        group, version, plural, ns, resource, secrets=secrets
+        group, version, plural, ns, obj, refresh=refresh, secrets=secrets
     )
 
 
 def apply_from_yaml(
-    resource: str = None, secrets: Secrets = None
+    resource: str = None, refresh: bool = False, secrets: Secrets = None
 ) -> Dict[str, Any]:
     """
     Apply the given custom resource, given as a YAML string, to the cluster.
+
+    Set `refresh` to bypass the short-lived response cache.
     """
-    obj = yaml.safe_load(resource)
+    obj = yaml.load(resource, Loader=_SafeLoader)
+    group, version, plural, ns = _extract_meta(obj)
 
-    api_version = obj.get("apiVersion")
-    kind = obj.get("kind")
-    ns = obj.get("metadata", {}).get("namespace", "default")
+    return create_custom_object(
+        group, version, plural, ns, obj, refresh=refresh, secrets=secrets
+    )
 
-    if not api_version:
-        raise ActivityFailed("missing apiVersion in resource")
 
-    if not kind:
-        raise ActivityFailed("missing kind in resource")
+def apply_all_from_yaml(
+    resource: str = None,
+    max_concurrency: int = 16,
+    refresh: bool = False,
+    secrets: Secrets = None,
+) -> List[Dict[str, Any]]:
+    """
+    Apply all documents of a multi-document YAML string to the cluster.
 
-    group, version = api_version.rsplit("/", 1)
-    plural = get_plural(kind)
+    Documents are created concurrently, sharing a single client
+    connection pool, rather than one blocking round-trip per document.
+    The returned list follows document order.
 
-    return create_custom_object(
-        group, version, plural, ns, resource, secrets=secrets
-    )
+    Set `refresh` to bypass the short-lived response cache.
+    """
+    objs = [
+        o for o in yaml.load_all(resource, Loader=_SafeLoader) if o is not None
+    ]
+
+    if not objs:
+        raise ActivityFailed("no resource found in YAML document")
+
+    calls = []
+    for obj in objs:
+        group, version, plural, ns = _extract_meta(obj)
+        calls.append((group, version, plural, ns, obj))
+
+    # build the client up front so every worker reuses its connection pool
+    _get_api(secrets)
+
+    def submit(call) -> Dict[str, Any]:
+        group, version, plural, ns, obj = call
+        return create_custom_object(
+            group, version, plural, ns, obj, refresh=refresh, secrets=secrets
+        )
+
+    max_workers = min(max_concurrency, len(calls))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(submit, calls))
 
 
 def create_custom_object(
@@ -84,33 +160,54 @@ def create_custom_object(
     ns: str = "default",
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    refresh: bool = False,
+    return_existing: bool = True,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Create a custom object in the given namespace. Its custom resource
     definition must already exists or this will fail with a 404.
 
+    Responses are kept in a short-lived cache so re-applying the same
+    resource does not round-trip to the API server. Set `refresh` to
+    bypass the cache. When the object already exists, set
+    `return_existing` to `False` to skip parsing the conflict payload
+    and get a small AlreadyExists status back instead. Set
+    `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
 
-    try:
-        r = api.create_namespaced_custom_object(
-            group, version, ns, plural, body, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        if x.status == 409:
-            logger.debug(
-                f"Custom resource object {group}/{version} already exists"
-            )
-            return json.loads(x.body)
-        else:
-            raise ActivityFailed(
-                f"Failed to create custom resource object: '{x.reason}' {x.body}"
-            )
+    # the flags are part of the key so a bare AlreadyExists status or
+    # raw bytes are never served to a caller expecting the full payload
+    key = _response_cache_key(group, version, plural, ns, body, secrets)
+    if key is not None:
+        key += (return_existing, parse_response)
+        if not refresh:
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+    result = _call(
+        "create_ns",
+        secrets,
+        group,
+        version,
+        ns,
+        plural,
+        body,
+        return_existing=return_existing,
+        parse_response=parse_response,
+    )
+    if key is not None:
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = result
+    return result
 
 
 def delete_custom_object(
@@ -119,26 +216,33 @@ def delete_custom_object(
     plural: str,
     name: str,
     ns: str = "default",
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Create a custom object cluster wide. Its custom resource
     definition must already exists or this will fail with a 404.
 
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
-
-    try:
-        r = api.delete_namespaced_custom_object(
-            group, version, ns, plural, name, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        raise ActivityFailed(
-            f"Failed to delete custom resource object: '{x.reason}' {x.body}"
-        )
+    result = _call(
+        "delete_ns",
+        secrets,
+        group,
+        version,
+        ns,
+        plural,
+        name,
+        parse_response=parse_response,
+    )
+    # a create for the same route within the TTL window must reach the
+    # API server again, not replay the pre-delete response
+    _invalidate_cached_responses(secrets, group, version, plural, ns)
+    return result
 
 
 def create_cluster_custom_object(
@@ -147,54 +251,80 @@ def create_cluster_custom_object(
     plural: str,
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    refresh: bool = False,
+    return_existing: bool = True,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Delete a custom object in the given namespace.
 
+    Responses are kept in a short-lived cache so re-applying the same
+    resource does not round-trip to the API server. Set `refresh` to
+    bypass the cache. When the object already exists, set
+    `return_existing` to `False` to skip parsing the conflict payload
+    and get a small AlreadyExists status back instead. Set
+    `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
 
-    try:
-        r = api.create_cluster_custom_object(
-            group, version, plural, body, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        if x.status == 409:
-            logger.debug(
-                f"Custom resource object {group}/{version} already exists"
-            )
-            return json.loads(x.body)
-        else:
-            raise ActivityFailed(
-                "Failed to create custom resource object: '{x.reason}' {x.body}"
-            )
+    key = _response_cache_key(group, version, plural, None, body, secrets)
+    if key is not None:
+        key += (return_existing, parse_response)
+        if not refresh:
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+    result = _call(
+        "create_cluster",
+        secrets,
+        group,
+        version,
+        plural,
+        body,
+        return_existing=return_existing,
+        parse_response=parse_response,
+    )
+    if key is not None:
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = result
+    return result
 
 
 def delete_cluster_custom_object(
-    group: str, version: str, plural: str, name: str, secrets: Secrets = None
-) -> Dict[str, Any]:
+    group: str,
+    version: str,
+    plural: str,
+    name: str,
+    parse_response: bool = True,
+    secrets: Secrets = None,
+) -> Union[Dict[str, Any], bytes]:
     """
     Delete a custom object cluster wide.
 
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
-
-    try:
-        r = api.delete_cluster_custom_object(
-            group, version, plural, name, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        raise ActivityFailed(
-            f"Failed to delete custom resource object: '{x.reason}' {x.body}"
-        )
+    result = _call(
+        "delete_cluster",
+        secrets,
+        group,
+        version,
+        plural,
+        name,
+        parse_response=parse_response,
+    )
+    _invalidate_cached_responses(secrets, group, version, plural)
+    return result
 
 
 def patch_custom_object(
@@ -206,34 +336,33 @@ def patch_custom_object(
     force: bool = False,
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Patch a custom object in the given namespace. The resource must be the
     updated version to apply. Force will re-acquire conflicting fields
     owned by others.
 
     The resource, or resource_as_yaml_file, must be a JSON Patch document.
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
 
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
-
-    try:
-        # https://github.com/kubernetes-client/python/issues/1216
-        api.api_client.set_default_header(
-            "Content-Type", "application/json-patch+json"
-        )
-        r = api.patch_namespaced_custom_object(
-            group, version, ns, plural, name, body, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        raise ActivityFailed(
-            f"Failed to patch custom resource object: '{x.reason}' {x.body}"
-        )
+    return _call(
+        "patch_ns",
+        secrets,
+        group,
+        version,
+        ns,
+        plural,
+        name,
+        body,
+        parse_response=parse_response,
+    )
 
 
 def replace_custom_object(
@@ -245,34 +374,32 @@ def replace_custom_object(
     force: bool = False,
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Replace a custom object in the given namespace. The resource must be the
     new version to apply.
 
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
-
-    try:
-        r = api.replace_namespaced_custom_object(
-            group,
-            version,
-            ns,
-            plural,
-            name,
-            body,
-            force=force,
-            _preload_content=False,
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        raise ActivityFailed(
-            f"Failed to replace custom resource object: '{x.reason}' {x.body}"
-        )
+    return _call(
+        "replace_ns",
+        secrets,
+        group,
+        version,
+        ns,
+        plural,
+        name,
+        body,
+        force=force,
+        parse_response=parse_response,
+    )
 
 
 def patch_cluster_custom_object(
@@ -283,34 +410,32 @@ def patch_cluster_custom_object(
     force: bool = False,
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Patch a custom object cluster-wide. The resource must be the
     updated version to apply. Force will re-acquire conflicting fields
     owned by others.
 
     The resource, or resource_as_yaml_file, must be a JSON Patch document.
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
 
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
-
-    try:
-        # https://github.com/kubernetes-client/python/issues/1216
-        api.api_client.set_default_header(
-            "Content-Type", "application/json-patch+json"
-        )
-        r = api.patch_cluster_custom_object(
-            group, version, plural, name, body, _preload_content=False
-        )
-        return json.loads(r.data)
-    except ApiException as x:
-        raise ActivityFailed(
-            f"Failed to patch custom resource object: '{x.reason}' {x.body}"
-        )
+    return _call(
+        "patch_cluster",
+        secrets,
+        group,
+        version,
+        plural,
+        name,
+        body,
+        parse_response=parse_response,
+    )
 
 
 def replace_cluster_custom_object(
@@ -321,38 +446,240 @@ def replace_cluster_custom_object(
     force: bool = False,
     resource: Dict[str, Any] = None,
     resource_as_yaml_file: str = None,
+    parse_response: bool = True,
     secrets: Secrets = None,
-) -> Dict[str, Any]:
+) -> Union[Dict[str, Any], bytes]:
     """
     Replace a custom object in the given namespace. The resource must be the
     new version to apply.
 
+    Set `parse_response` to `False` to get the raw response bytes back
+    without decoding them.
+
     Read more about custom resources here:
     https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/custom-resources/
     """  # noqa: E501
-    api = client.CustomObjectsApi(create_k8s_api_client(secrets))
     body = load_body(resource, resource_as_yaml_file)
+    return _call(
+        "replace_cluster",
+        secrets,
+        group,
+        version,
+        plural,
+        name,
+        body,
+        force=force,
+        parse_response=parse_response,
+    )
+
+
+###############################################################################
+# Internal functions
+###############################################################################
+# absorbs repeated applies of the same manifest, typically from
+# steady-state probes re-running during an experiment; cachetools
+# caches are not thread-safe and apply_all_from_yaml reaches this
+# cache from worker threads, so every access takes the lock
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=15)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+_API_CACHE_MAX_SIZE = 32
+_API_CACHE: Dict[Any, client.CustomObjectsApi] = {}
+_PATCH_API_CACHE: Dict[Any, client.CustomObjectsApi] = {}
+
 
+def _response_cache_key(
+    group: str,
+    version: str,
+    plural: str,
+    ns: str,
+    body: Dict[str, Any],
+    secrets: Secrets,
+) -> Any:
+    """
+    Build the response-cache key, or `None` when the secrets or body
+    cannot be keyed, in which case the response must not be cached. The
+    secrets are part of the key so responses from one cluster are never
+    served for a call targeting another.
+    """
+    skey = _secrets_cache_key(secrets)
+    if skey is None:
+        return None
     try:
-        r = api.replace_cluster_custom_object(
-            group,
-            version,
-            plural,
-            name,
-            body,
-            force=force,
-            _preload_content=False,
+        digest = hashlib.blake2b(_canonical_dumps(body)).digest()
+    except TypeError:
+        # values the serializer cannot dump as-is, such as datetimes
+        # from unquoted YAML scalars, which the kubernetes client
+        # itself coerces before sending
+        return None
+    return (skey, group, version, plural, ns, digest)
+
+
+def _invalidate_cached_responses(
+    secrets: Secrets, group: str, version: str, plural: str, ns: str = None
+) -> None:
+    """
+    Drop cached create responses for the given route so deleting an
+    object followed by re-creating it within the TTL window is not
+    absorbed by the cache.
+    """
+    prefix = (_secrets_cache_key(secrets), group, version, plural, ns)
+    with _RESPONSE_CACHE_LOCK:
+        for key in [k for k in _RESPONSE_CACHE if k[:5] == prefix]:
+            _RESPONSE_CACHE.pop(key, None)
+
+
+def _extract_meta(obj: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """
+    Pull the routing fields from an already-parsed resource.
+
+    The apply helpers parse the resource once and reuse the parsed
+    mapping as the request body, so no field is ever decoded twice.
+    """
+    api_version = obj.get("apiVersion")
+    kind = obj.get("kind")
+    md = obj.get("metadata")
+    ns = md.get("namespace", "default") if md else "default"
+
+    if not api_version:
+        raise ActivityFailed("missing apiVersion in resource")
+
+    if not kind:
+        raise ActivityFailed("missing kind in resource")
+
+    group, sep, version = api_version.partition("/")
+    if not sep:
+        raise ActivityFailed(
+            "apiVersion must be of the form <group>/<version>"
         )
-        return json.loads(r.data)
+
+    # repeated applies of the same kind keep producing these few strings;
+    # interning collapses them into shared objects instead of fresh
+    # allocations on every call
+    return (
+        sys.intern(group),
+        sys.intern(version),
+        sys.intern(get_plural(kind)),
+        ns,
+    )
+
+
+# per-operation dispatch: the api method to invoke, the verb used in
+# error messages and whether a 409 conflict is an acceptable outcome
+_OPS: Dict[str, Any] = {
+    "create_ns": ("create_namespaced_custom_object", "create", True),
+    "create_cluster": ("create_cluster_custom_object", "create", True),
+    "delete_ns": ("delete_namespaced_custom_object", "delete", False),
+    "delete_cluster": ("delete_cluster_custom_object", "delete", False),
+    "patch_ns": ("patch_namespaced_custom_object", "patch", False),
+    "patch_cluster": ("patch_cluster_custom_object", "patch", False),
+    "replace_ns": ("replace_namespaced_custom_object", "replace", False),
+    "replace_cluster": ("replace_cluster_custom_object", "replace", False),
+}
+
+
+def _call(
+    op: str,
+    secrets: Secrets,
+    *args: Any,
+    return_existing: bool = True,
+    parse_response: bool = True,
+    **kwargs: Any,
+) -> Union[Dict[str, Any], bytes]:
+    """
+    Invoke the api method mapped to `op` and parse its response.
+
+    All custom object operations share the same call/parse/error shape,
+    so they funnel through this single helper rather than repeating it.
+    """
+    method, verb, allow_conflict = _OPS[op]
+    api = _get_patch_api(secrets) if verb == "patch" else _get_api(secrets)
+
+    try:
+        r = getattr(api, method)(*args, _preload_content=False, **kwargs)
+        return _json.loads(r.data) if parse_response else r.data
     except ApiException as x:
+        if allow_conflict and x.status == 409:
+            logger.debug(
+                f"Custom resource object {args[0]}/{args[1]} already exists"
+            )
+            if not return_existing:
+                # the caller only cares that the object exists, no need
+                # to parse the potentially large error payload
+                return {"status": "AlreadyExists", "reason": x.reason}
+            return _json.loads(x.body) if parse_response else x.body
         raise ActivityFailed(
-            f"Failed to replace custom resource object: '{x.reason}' {x.body}"
+            f"Failed to {verb} custom resource object: '{x.reason}' {x.body}"
         )
 
 
-###############################################################################
-# Internal functions
-###############################################################################
+def _secrets_cache_key(secrets: Secrets) -> Any:
+    """
+    Derive a hashable cache key from a secrets mapping, or `None` when
+    its values are unhashable, in which case nothing must be cached:
+    keying on object identity could alias a recycled address to stale
+    credentials.
+    """
+    try:
+        return frozenset((secrets or {}).items())
+    except TypeError:
+        return None
+
+
+def _cache_api(
+    cache: Dict[Any, client.CustomObjectsApi],
+    key: Any,
+    api: client.CustomObjectsApi,
+) -> client.CustomObjectsApi:
+    # evict the oldest entry first; distinct secrets are few enough in
+    # practice that anything smarter than FIFO is not worth it
+    if len(cache) >= _API_CACHE_MAX_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = api
+    return api
+
+
+def _get_api(secrets: Secrets = None) -> client.CustomObjectsApi:
+    """
+    Return a `CustomObjectsApi` for the given secrets, reusing a previously
+    built client so that repeated calls share a single connection pool
+    rather than renegotiating TLS on every activity.
+    """
+    key = _secrets_cache_key(secrets)
+    if key is None:
+        return client.CustomObjectsApi(create_k8s_api_client(secrets))
+
+    api = _API_CACHE.get(key)
+    if api is None:
+        api = _cache_api(
+            _API_CACHE,
+            key,
+            client.CustomObjectsApi(create_k8s_api_client(secrets)),
+        )
+    return api
+
+
+def _get_patch_api(secrets: Secrets = None) -> client.CustomObjectsApi:
+    """
+    Return a `CustomObjectsApi` dedicated to JSON Patch calls.
+
+    The patch content-type is set once when the client is built, rather
+    than mutated on the shared client before every patch, which raced
+    with concurrent non-patch calls on the same api_client.
+    """
+    key = _secrets_cache_key(secrets)
+    api = _PATCH_API_CACHE.get(key) if key is not None else None
+    if api is None:
+        api = client.CustomObjectsApi(create_k8s_api_client(secrets))
+        # https://github.com/kubernetes-client/python/issues/1216
+        api.api_client.set_default_header(
+            "Content-Type", "application/json-patch+json"
+        )
+        if key is not None:
+            _cache_api(_PATCH_API_CACHE, key, api)
+    return api
+
+
 def load_body(
     body_as_object: Dict[str, Any] = None, body_as_yaml_file: str = None
 ) -> Dict[str, Any]:
@@ -364,26 +691,63 @@ def load_body(
     if body_as_object is not None:
         return body_as_object
 
-    if not os.path.isfile(body_as_yaml_file):
+    # a single open call rather than stat-then-open, which both costs an
+    # extra syscall and races with the file changing underneath
+    try:
+        f = open(body_as_yaml_file, "rb")
+    except (FileNotFoundError, IsADirectoryError, PermissionError):
         raise ActivityFailed(
             f"Path '{body_as_yaml_file}' is not a valid resource file"
         )
-    else:
-        with open(body_as_yaml_file) as f:
-            return yaml.safe_load(f.read())
+
+    with f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_SafeLoader)
+        except ValueError:
+            # empty files cannot be mapped
+            return yaml.load(f, Loader=_SafeLoader)
+
+
+# preseeded with the common kinds so most lookups are a single dict hit,
+# lazily extended as new kinds are pluralized
+_PLURAL_CACHE: Dict[str, str] = {
+    "configmap": "configmaps",
+    "cronjob": "cronjobs",
+    "daemonset": "daemonsets",
+    "deployment": "deployments",
+    "endpoints": "endpoints",
+    "ingress": "ingresses",
+    "job": "jobs",
+    "namespace": "namespaces",
+    "networkpolicy": "networkpolicies",
+    "node": "nodes",
+    "pod": "pods",
+    "replicaset": "replicasets",
+    "secret": "secrets",
+    "service": "services",
+    "statefulset": "statefulsets",
+}
+
+
+# indexed by the last character of the singular: the suffix to append
+# and how many characters to strip, replacing the comparison chain
+_SUFFIX_TABLE = [("s", 0)] * 128
+_SUFFIX_TABLE[ord("s")] = ("es", 0)
+_SUFFIX_TABLE[ord("y")] = ("ies", 1)
 
 
 # https://github.com/kubernetes/kubernetes/blob/v1.28.2/staging/src/k8s.io/apimachinery/pkg/api/meta/restmapper.go#L126
 def get_plural(singular: str) -> str:
     singular = singular.lower()
 
-    if singular == "endpoints":
-        return singular
+    plural = _PLURAL_CACHE.get(singular)
+    if plural is not None:
+        return plural
 
-    last = singular[-1]
-    if last == "s":
-        return singular + "es"
-    elif last == "y":
-        return singular[:-1] + "ies"
+    last = ord(singular[-1])
+    add, strip = _SUFFIX_TABLE[last] if last < 128 else ("s", 0)
+    plural = (singular[:-strip] if strip else singular) + add
 
-    return singular + "s"
+    _PLURAL_CACHE[singular] = plural
+    return plural
@@ -0,0 +1,16 @@
+import pytest
+
+from chaosk8s.crd import actions as crd_actions
+
+
+@pytest.fixture(autouse=True)
+def clear_crd_api_cache():
+    # the CRD actions cache their api clients across calls; each test patches
+    # `chaosk8s.crd.actions.client` anew so stale entries must not leak over
+    crd_actions._API_CACHE.clear()
+    crd_actions._PATCH_API_CACHE.clear()
+    crd_actions._RESPONSE_CACHE.clear()
+    yield
+    crd_actions._API_CACHE.clear()
+    crd_actions._PATCH_API_CACHE.clear()
+    crd_actions._RESPONSE_CACHE.clear()
@@ -8,6 +8,7 @@ from chaoslib.exceptions import ActivityFailed
 from kubernetes.client.rest import ApiException
 
 from chaosk8s.crd.actions import (
+    apply_all_from_yaml,
     apply_from_json,
     apply_from_yaml,
     create_cluster_custom_object,
@@ -556,3 +557,221 @@ def test_apply_from_yaml(cl, client, has_conf):
         ANY,
         _preload_content=False,
     )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_creating_cro_reuses_cached_response(cl, client, has_conf):
+    has_conf.return_value = False
+
+    resp_data = {"apiVersion": "stable.example.com/v1", "kind": "CronTab"}
+    resp = MagicMock()
+    resp.data = json.dumps(resp_data)
+    resource = {
+        "apiVersion": "stable.example.com/v1",
+        "kind": "CronTab",
+        "metadata": {"name": "my-new-cron-object"},
+        "spec": {"cronSpec": "* * * * */5", "image": "my-awesome-cron-image"},
+    }
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.create_namespaced_custom_object.return_value = resp
+
+    o = create_custom_object(
+        group="stable.example.com", version="v1", plural="crontabs", resource=resource
+    )
+    assert o == resp_data
+
+    o = create_custom_object(
+        group="stable.example.com", version="v1", plural="crontabs", resource=resource
+    )
+    assert o == resp_data
+    assert v1.create_namespaced_custom_object.call_count == 1
+
+    create_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        resource=resource,
+        refresh=True,
+    )
+    assert v1.create_namespaced_custom_object.call_count == 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_apply_all_from_yaml(cl, client, has_conf):
+    has_conf.return_value = False
+
+    resp_data = {"apiVersion": "stable.example.com/v1", "kind": "CronTab"}
+    resp = MagicMock()
+    resp.data = json.dumps(resp_data)
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.create_namespaced_custom_object.return_value = resp
+
+    docs = "---\n".join(
+        yaml.safe_dump(
+            {
+                "apiVersion": "stable.example.com/v1",
+                "kind": "CronTab",
+                "metadata": {"name": f"my-new-cron-object-{i}"},
+                "spec": {
+                    "cronSpec": "* * * * */5",
+                    "image": "my-awesome-cron-image",
+                },
+            }
+        )
+        for i in range(3)
+    )
+
+    o = apply_all_from_yaml(resource=docs)
+    assert o == [resp_data, resp_data, resp_data]
+
+    assert v1.create_namespaced_custom_object.call_count == 3
+    v1.create_namespaced_custom_object.assert_called_with(
+        "stable.example.com",
+        "v1",
+        "default",
+        "crontabs",
+        ANY,
+        _preload_content=False,
+    )
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_creating_cro_conflict_without_existing_payload(cl, client, has_conf):
+    has_conf.return_value = False
+
+    resp = MagicMock()
+    resp.status = 409
+    resp.reason = "Conflicts"
+    resp.data = json.dumps({"kind": "Status", "code": 409})
+    resource = {
+        "apiVersion": "stable.example.com/v1",
+        "kind": "CronTab",
+        "metadata": {"name": "my-new-cron-object"},
+        "spec": {"cronSpec": "* * * * */5", "image": "my-awesome-cron-image"},
+    }
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.create_namespaced_custom_object.side_effect = ApiException(http_resp=resp)
+
+    o = create_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        resource=resource,
+        return_existing=False,
+    )
+    assert o == {"status": "AlreadyExists", "reason": "Conflicts"}
+
+    assert v1.create_namespaced_custom_object.call_count == 1
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_deleting_cro_without_parsing_response(cl, client, has_conf):
+    has_conf.return_value = False
+
+    raw = json.dumps({"status": "Success"}).encode("utf-8")
+    resp = MagicMock()
+    resp.data = raw
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.delete_namespaced_custom_object.return_value = resp
+
+    o = delete_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        name="my-new-cron-object",
+        parse_response=False,
+    )
+    assert o == raw
+
+    assert v1.delete_namespaced_custom_object.call_count == 1
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_creating_cro_cache_is_scoped_to_secrets(cl, client, has_conf):
+    has_conf.return_value = False
+
+    resp_data = {"apiVersion": "stable.example.com/v1", "kind": "CronTab"}
+    resp = MagicMock()
+    resp.data = json.dumps(resp_data)
+    resource = {
+        "apiVersion": "stable.example.com/v1",
+        "kind": "CronTab",
+        "metadata": {"name": "my-new-cron-object"},
+        "spec": {"cronSpec": "* * * * */5", "image": "my-awesome-cron-image"},
+    }
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.create_namespaced_custom_object.return_value = resp
+
+    create_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        resource=resource,
+        secrets={"KUBERNETES_HOST": "http://cluster-a"},
+    )
+    create_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        resource=resource,
+        secrets={"KUBERNETES_HOST": "http://cluster-b"},
+    )
+
+    assert v1.create_namespaced_custom_object.call_count == 2
+
+
+@patch("chaosk8s.has_local_config_file", autospec=True)
+@patch("chaosk8s.crd.actions.client", autospec=True)
+@patch("chaosk8s.client")
+def test_deleting_cro_invalidates_cached_responses(cl, client, has_conf):
+    has_conf.return_value = False
+
+    resp_data = {"apiVersion": "stable.example.com/v1", "kind": "CronTab"}
+    resp = MagicMock()
+    resp.data = json.dumps(resp_data)
+    resource = {
+        "apiVersion": "stable.example.com/v1",
+        "kind": "CronTab",
+        "metadata": {"name": "my-new-cron-object"},
+        "spec": {"cronSpec": "* * * * */5", "image": "my-awesome-cron-image"},
+    }
+
+    v1 = MagicMock()
+    client.CustomObjectsApi.return_value = v1
+    v1.create_namespaced_custom_object.return_value = resp
+    v1.delete_namespaced_custom_object.return_value = resp
+
+    create_custom_object(
+        group="stable.example.com", version="v1", plural="crontabs", resource=resource
+    )
+    delete_custom_object(
+        group="stable.example.com",
+        version="v1",
+        plural="crontabs",
+        name="my-new-cron-object",
+    )
+    create_custom_object(
+        group="stable.example.com", version="v1", plural="crontabs", resource=resource
+    )
+
+    assert v1.create_namespaced_custom_object.call_count == 2